@@ -7,11 +7,12 @@
 # the Business Source License, use of this software will be governed
 # by the Apache License, Version 2.0
 
-import http.client
+from concurrent.futures import ThreadPoolExecutor
 import json
 import logging
 import uuid
 import requests
+from requests.adapters import HTTPAdapter
 import time
 import random
 import os
@@ -35,11 +36,26 @@ HTTP_POST_HEADERS = {
     "Content-Type": "application/vnd.schemaregistry.v1+json"
 }
 
+# Error codes that may appear during normal API operation, do not
+# indicate an issue with the service
+ACCEPTABLE_ERRORS = frozenset({409, 422, 404})
+
+
+def accept_response(resp):
+    return 200 <= resp.status_code < 300 or resp.status_code in ACCEPTABLE_ERRORS
+
+
 schema1_def = '{"type":"record","name":"myrecord","fields":[{"type":"string","name":"f1"}]}'
 schema2_def = '{"type":"record","name":"myrecord","fields":[{"type":"string","name":"f1"},{"type":"string","name":"f2","default":"foo"}]}'
 schema3_def = '{"type":"record","name":"myrecord","fields":[{"type":"string","name":"f1"},{"type":"string","name":"f2"}]}'
 invalid_avro = '{"type":"notatype","name":"myrecord","fields":[{"type":"string","name":"f1"}]}'
 
+# Request bodies for registering the schemas above
+schema1_data = json.dumps({"schema": schema1_def}).encode()
+schema2_data = json.dumps({"schema": schema2_def}).encode()
+schema3_data = json.dumps({"schema": schema3_def}).encode()
+invalid_avro_data = json.dumps({"schema": invalid_avro}).encode()
+
 
 class SchemaRegistryTest(RedpandaTest):
     """
@@ -54,11 +70,38 @@ class SchemaRegistryTest(RedpandaTest):
             extra_rp_conf={"auto_create_topics_enabled": False},
             num_cores=1)
 
-        http.client.HTTPConnection.debuglevel = 1
-        http.client.print = lambda *args: self.logger.debug(" ".join(args))
-
         self._ctx = context
 
+        # Topic names for use by individual tests
+        self._topic_pool = iter(create_topic_names(32))
+
+        # Share one session between all requests in a test, so that
+        # keep-alive connections to each node are reused rather than
+        # reconnecting on every call.
+        self._session = requests.Session()
+        self._session.mount(
+            "http://",
+            HTTPAdapter(pool_connections=8, pool_maxsize=32, max_retries=0))
+
+        # Base URI for each hostname we have sent requests to
+        self._uri_cache = {}
+
+    def setUp(self):
+        super().setUp()
+
+        # Warm up the servers (schema_registry doesn't create topic etc before
+        # first access), so that the cost isn't paid by the first request in
+        # each test body.
+        for node in self.redpanda.nodes:
+            r = self._request("GET",
+                              "subjects",
+                              hostname=node.account.hostname)
+            assert r.status_code == requests.codes.ok
+
+    def tearDown(self):
+        self._session.close()
+        super().tearDown()
+
     def _request(self, verb, path, hostname=None, **kwargs):
         """
 
@@ -71,42 +114,44 @@ class SchemaRegistryTest(RedpandaTest):
         if hostname is None:
             # Pick hostname once: we will retry the same place we got an error,
             # to avoid silently skipping hosts that are persistently broken
-            nodes = [n for n in self.redpanda.nodes]
-            random.shuffle(nodes)
-            node = nodes[0]
+            node = random.choice(self.redpanda.nodes)
             hostname = node.account.hostname
 
-        uri = f"http://{hostname}:8081/{path}"
-
-        if 'timeout' not in kwargs:
-            kwargs['timeout'] = 60
+        base_uri = self._uri_cache.get(hostname)
+        if base_uri is None:
+            base_uri = self._uri_cache[hostname] = f"http://{hostname}:8081/"
+        uri = base_uri + path
 
-        # Error codes that may appear during normal API operation, do not
-        # indicate an issue with the service
-        acceptable_errors = {409, 422, 404}
+        kwargs.setdefault('timeout', 60)
 
-        def accept_response(resp):
-            return 200 <= resp.status_code < 300 or resp.status_code in acceptable_errors
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"{verb} hostname={hostname} {path} {kwargs}")
 
-        self.logger.debug(f"{verb} hostname={hostname} {path} {kwargs}")
+        r = self._session.request(verb, uri, **kwargs)
+        if accept_response(r):
+            self.logger.info(
+                f"{r.status_code} {verb} hostname={hostname} {path} {kwargs}")
+            return r
 
-        # This is not a retry loop: you get *one* retry to handle issues
-        # during startup, after that a failure is a failure.
-        r = requests.request(verb, uri, **kwargs)
-        if not accept_response(r):
+        # This is not a general retry loop: retries with a short jittered
+        # backoff ride out issues during startup (about 10s in total), after
+        # that a failure is a failure.
+        for attempt in range(8):
             self.logger.info(
                 f"Retrying for error {r.status_code} on {verb} {path} ({r.text})"
             )
-            time.sleep(10)
-            r = requests.request(verb, uri, **kwargs)
+            time.sleep(min(2.0, 0.1 * (2**attempt)) + random.uniform(0, 0.1))
+            r = self._session.request(verb, uri, **kwargs)
             if accept_response(r):
-                self.logger.info(
-                    f"OK after retry {r.status_code} on {verb} {path} ({r.text})"
-                )
-            else:
-                self.logger.info(
-                    f"Error after retry {r.status_code} on {verb} {path} ({r.text})"
-                )
+                break
+
+        if accept_response(r):
+            self.logger.info(
+                f"OK after retry {r.status_code} on {verb} {path} ({r.text})")
+        else:
+            self.logger.info(
+                f"Error after retry {r.status_code} on {verb} {path} ({r.text})"
+            )
 
         self.logger.info(
             f"{r.status_code} {verb} hostname={hostname} {path} {kwargs}")
@@ -117,22 +162,27 @@ class SchemaRegistryTest(RedpandaTest):
         return f"http://{self.redpanda.nodes[0].account.hostname}:8081"
 
     def _get_topics(self):
-        return requests.get(
+        return self._session.get(
             f"http://{self.redpanda.nodes[0].account.hostname}:8082/topics")
 
     def _create_topics(self,
-                       names=create_topic_names(1),
+                       names=None,
                        partitions=1,
                        replicas=1,
                        cleanup_policy=TopicSpec.CLEANUP_DELETE):
+        names = names if names is not None else create_topic_names(1)
         self.logger.debug(f"Creating topics: {names}")
         kafka_tools = KafkaCliTools(self.redpanda)
-        for name in names:
-            kafka_tools.create_topic(
-                TopicSpec(name=name,
-                          partition_count=partitions,
-                          replication_factor=replicas))
-        assert set(names).issubset(self._get_topics().json())
+        # Each create is a separate CLI process, so run them side by side
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(
+                executor.map(
+                    lambda name: kafka_tools.create_topic(
+                        TopicSpec(name=name,
+                                  partition_count=partitions,
+                                  replication_factor=replicas)), names))
+        topics = set(self._get_topics().json())
+        assert set(names).issubset(topics)
         return names
 
     def _get_config(self, headers=HTTP_GET_HEADERS):
@@ -247,6 +297,32 @@ class SchemaRegistryTest(RedpandaTest):
             headers=headers,
             data=data)
 
+    def _prep_three_schemas(self, subject):
+        """
+        Register schemas 1, 2 and 3 as versions 1, 2 and 3 of a subject,
+        with compatibility checking disabled so that all three are accepted.
+        """
+        self.logger.debug("Posting schema 1 as a subject key")
+        result_raw = self._post_subjects_subject_versions(subject=subject,
+                                                          data=schema1_data)
+        self.logger.debug("%s", result_raw)
+        assert result_raw.status_code == requests.codes.ok
+
+        self.logger.debug("Set subject config - NONE")
+        result_raw = self._set_config_subject(subject=subject,
+                                              data=json.dumps(
+                                                  {"compatibility": "NONE"}))
+        assert result_raw.status_code == requests.codes.ok
+
+        # Posted one at a time, so that tests can rely on which schema
+        # is which version.
+        for n, data in ((2, schema2_data), (3, schema3_data)):
+            self.logger.debug(f"Posting schema {n} as a subject key")
+            result_raw = self._post_subjects_subject_versions(subject=subject,
+                                                              data=data)
+            self.logger.debug("%s", result_raw)
+            assert result_raw.status_code == requests.codes.ok
+
     @cluster(num_nodes=3)
     def test_schemas_types(self):
         """
@@ -271,19 +347,17 @@ class SchemaRegistryTest(RedpandaTest):
         self.logger.debug("Checking schema 1 versions - expect 40403")
         result_raw = self._get_schemas_ids_id_versions(id=1)
         assert result_raw.status_code == requests.codes.not_found
-        assert result_raw.json()["error_code"] == 40403
-        assert result_raw.json()["message"] == "Schema 1 not found"
+        result = result_raw.json()
+        assert result["error_code"] == 40403
+        assert result["message"] == "Schema 1 not found"
 
-        topic = create_topic_names(1)[0]
+        topic = next(self._topic_pool)
         subject = f"{topic}-key"
 
-        schema_1_data = json.dumps({"schema": schema1_def})
-        schema_2_data = json.dumps({"schema": schema2_def})
-
         self.logger.debug("Posting schema 1 as a subject key")
         result_raw = self._post_subjects_subject_versions(subject=subject,
-                                                          data=schema_1_data)
-        self.logger.debug(result_raw)
+                                                          data=schema1_data)
+        self.logger.debug("%s", result_raw)
         assert result_raw.status_code == requests.codes.ok
         assert result_raw.json()["id"] == 1
 
@@ -294,8 +368,8 @@ class SchemaRegistryTest(RedpandaTest):
 
         self.logger.debug("Posting schema 2 as a subject key")
         result_raw = self._post_subjects_subject_versions(subject=subject,
-                                                          data=schema_2_data)
-        self.logger.debug(result_raw)
+                                                          data=schema2_data)
+        self.logger.debug("%s", result_raw)
         assert result_raw.status_code == requests.codes.ok
         assert result_raw.json()["id"] == 2
 
@@ -338,41 +412,41 @@ class SchemaRegistryTest(RedpandaTest):
         Verify posting a schema
         """
 
-        topic = create_topic_names(1)[0]
+        topic = next(self._topic_pool)
 
         self.logger.debug(f"Register a schema against a subject")
-        schema_1_data = json.dumps({"schema": schema1_def})
 
         self.logger.debug("Get empty subjects")
         result_raw = self._get_subjects()
-        if result_raw.json() != []:
-            self.logger.error(result_raw.json)
-        assert result_raw.json() == []
+        result = result_raw.json()
+        if result != []:
+            self.logger.error(result)
+        assert result == []
 
         self.logger.debug("Posting invalid schema as a subject key")
         result_raw = self._post_subjects_subject_versions(
-            subject=f"{topic}-key", data=json.dumps({"schema": invalid_avro}))
-        self.logger.debug(result_raw)
+            subject=f"{topic}-key", data=invalid_avro_data)
+        self.logger.debug("%s", result_raw)
         assert result_raw.status_code == requests.codes.unprocessable_entity
 
         self.logger.debug("Posting schema 1 as a subject key")
         result_raw = self._post_subjects_subject_versions(
-            subject=f"{topic}-key", data=schema_1_data)
-        self.logger.debug(result_raw)
+            subject=f"{topic}-key", data=schema1_data)
+        self.logger.debug("%s", result_raw)
         assert result_raw.status_code == requests.codes.ok
         assert result_raw.json()["id"] == 1
 
         self.logger.debug("Reposting schema 1 as a subject key")
         result_raw = self._post_subjects_subject_versions(
-            subject=f"{topic}-key", data=schema_1_data)
-        self.logger.debug(result_raw)
+            subject=f"{topic}-key", data=schema1_data)
+        self.logger.debug("%s", result_raw)
         assert result_raw.status_code == requests.codes.ok
         assert result_raw.json()["id"] == 1
 
         self.logger.debug("Reposting schema 1 as a subject value")
         result_raw = self._post_subjects_subject_versions(
-            subject=f"{topic}-value", data=schema_1_data)
-        self.logger.debug(result_raw)
+            subject=f"{topic}-value", data=schema1_data)
+        self.logger.debug("%s", result_raw)
         assert result_raw.status_code == requests.codes.ok
         assert result_raw.json()["id"] == 1
 
@@ -453,14 +527,13 @@ class SchemaRegistryTest(RedpandaTest):
         Verify posting a schema
         """
 
-        topic = create_topic_names(1)[0]
+        topic = next(self._topic_pool)
         subject = f"{topic}-key"
 
         self.logger.info(
             "Posting against non-existant subject should be 40401")
         result_raw = self._post_subjects_subject(subject=subject,
-                                                 data=json.dumps(
-                                                     {"schema": schema1_def}))
+                                                 data=schema1_data)
         self.logger.info(result_raw)
         self.logger.info(result_raw.content)
         assert result_raw.status_code == requests.codes.not_found
@@ -471,8 +544,7 @@ class SchemaRegistryTest(RedpandaTest):
         self.logger.info(
             "Posting invalid schema to non-existant subject should be 40401")
         result_raw = self._post_subjects_subject(subject=subject,
-                                                 data=json.dumps(
-                                                     {"schema": invalid_avro}))
+                                                 data=invalid_avro_data)
         self.logger.info(result_raw)
         self.logger.info(result_raw.content)
         assert result_raw.status_code == requests.codes.not_found
@@ -481,8 +553,8 @@ class SchemaRegistryTest(RedpandaTest):
         assert result["message"] == f"Subject '{subject}' not found."
 
         self.logger.info("Posting schema 1 as a subject key")
-        result_raw = self._post_subjects_subject_versions(
-            subject=subject, data=json.dumps({"schema": schema1_def}))
+        result_raw = self._post_subjects_subject_versions(subject=subject,
+                                                          data=schema1_data)
         self.logger.info(result_raw)
         self.logger.info(result_raw.content)
         assert result_raw.status_code == requests.codes.ok
@@ -491,8 +563,7 @@ class SchemaRegistryTest(RedpandaTest):
         self.logger.info(
             "Posting invalid schema to existing subject should be 500")
         result_raw = self._post_subjects_subject(subject=subject,
-                                                 data=json.dumps(
-                                                     {"schema": invalid_avro}))
+                                                 data=invalid_avro_data)
         self.logger.info(result_raw)
         self.logger.info(result_raw.content)
         assert result_raw.status_code == requests.codes.internal_server_error
@@ -503,8 +574,7 @@ class SchemaRegistryTest(RedpandaTest):
 
         self.logger.info("Posting existing schema should be success")
         result_raw = self._post_subjects_subject(subject=subject,
-                                                 data=json.dumps(
-                                                     {"schema": schema1_def}))
+                                                 data=schema1_data)
         self.logger.info(result_raw)
         self.logger.info(result_raw.content)
         assert result_raw.status_code == requests.codes.ok
@@ -516,8 +586,7 @@ class SchemaRegistryTest(RedpandaTest):
 
         self.logger.info("Posting new schema should be 40403")
         result_raw = self._post_subjects_subject(subject=subject,
-                                                 data=json.dumps(
-                                                     {"schema": schema3_def}))
+                                                 data=schema3_data)
         self.logger.info(result_raw)
         self.logger.info(result_raw.content)
         assert result_raw.status_code == requests.codes.not_found
@@ -541,8 +610,8 @@ class SchemaRegistryTest(RedpandaTest):
 
         # Check out set write shows up in a read
         result_raw = self._get_config()
-        self.logger.debug(
-            f"response {result_raw.status_code} {result_raw.text}")
+        self.logger.debug("response %s %s", result_raw.status_code,
+                          result_raw.text)
         assert result_raw.json()["compatibilityLevel"] == "FULL"
 
         self.logger.debug("Get invalid subject config")
@@ -550,13 +619,11 @@ class SchemaRegistryTest(RedpandaTest):
         assert result_raw.status_code == requests.codes.not_found
         assert result_raw.json()["error_code"] == 40401
 
-        schema_1_data = json.dumps({"schema": schema1_def})
-
-        topic = create_topic_names(1)[0]
+        topic = next(self._topic_pool)
 
         self.logger.debug("Posting schema 1 as a subject key")
         result_raw = self._post_subjects_subject_versions(
-            subject=f"{topic}-key", data=schema_1_data)
+            subject=f"{topic}-key", data=schema1_data)
 
         self.logger.debug("Get subject config - should fail")
         result_raw = self._get_config_subject(subject=f"{topic}-key")
@@ -586,17 +653,14 @@ class SchemaRegistryTest(RedpandaTest):
         Verify compatibility
         """
 
-        topic = create_topic_names(1)[0]
+        topic = next(self._topic_pool)
 
         self.logger.debug(f"Register a schema against a subject")
-        schema_1_data = json.dumps({"schema": schema1_def})
-        schema_2_data = json.dumps({"schema": schema2_def})
-        schema_3_data = json.dumps({"schema": schema3_def})
 
         self.logger.debug("Posting schema 1 as a subject key")
         result_raw = self._post_subjects_subject_versions(
-            subject=f"{topic}-key", data=schema_1_data)
-        self.logger.debug(result_raw)
+            subject=f"{topic}-key", data=schema1_data)
+        self.logger.debug("%s", result_raw)
         assert result_raw.status_code == requests.codes.ok
 
         self.logger.debug("Set subject config - NONE")
@@ -607,7 +671,7 @@ class SchemaRegistryTest(RedpandaTest):
 
         self.logger.debug("Check compatibility none, no default")
         result_raw = self._post_compatibility_subject_version(
-            subject=f"{topic}-key", version=1, data=schema_2_data)
+            subject=f"{topic}-key", version=1, data=schema2_data)
         assert result_raw.status_code == requests.codes.ok
         assert result_raw.json()["is_compatible"] == True
 
@@ -619,25 +683,25 @@ class SchemaRegistryTest(RedpandaTest):
 
         self.logger.debug("Check compatibility backward, with default")
         result_raw = self._post_compatibility_subject_version(
-            subject=f"{topic}-key", version=1, data=schema_2_data)
+            subject=f"{topic}-key", version=1, data=schema2_data)
         assert result_raw.status_code == requests.codes.ok
         assert result_raw.json()["is_compatible"] == True
 
         self.logger.debug("Check compatibility backward, no default")
         result_raw = self._post_compatibility_subject_version(
-            subject=f"{topic}-key", version=1, data=schema_3_data)
+            subject=f"{topic}-key", version=1, data=schema3_data)
         assert result_raw.status_code == requests.codes.ok
         assert result_raw.json()["is_compatible"] == False
 
         self.logger.debug("Posting incompatible schema 3 as a subject key")
         result_raw = self._post_subjects_subject_versions(
-            subject=f"{topic}-key", data=schema_3_data)
+            subject=f"{topic}-key", data=schema3_data)
         assert result_raw.status_code == requests.codes.conflict
         assert result_raw.json()["error_code"] == 409
 
         self.logger.debug("Posting compatible schema 2 as a subject key")
         result_raw = self._post_subjects_subject_versions(
-            subject=f"{topic}-key", data=schema_2_data)
+            subject=f"{topic}-key", data=schema2_data)
         assert result_raw.status_code == requests.codes.ok
 
     @cluster(num_nodes=3)
@@ -646,42 +710,15 @@ class SchemaRegistryTest(RedpandaTest):
         Verify delete subject
         """
 
-        topic = create_topic_names(1)[0]
-
-        self.logger.debug(f"Register a schema against a subject")
-        schema_1_data = json.dumps({"schema": schema1_def})
-        schema_2_data = json.dumps({"schema": schema2_def})
-        schema_3_data = json.dumps({"schema": schema3_def})
+        topic = next(self._topic_pool)
 
-        self.logger.debug("Posting schema 1 as a subject key")
-        result_raw = self._post_subjects_subject_versions(
-            subject=f"{topic}-key", data=schema_1_data)
-        self.logger.debug(result_raw)
-        assert result_raw.status_code == requests.codes.ok
-
-        self.logger.debug("Set subject config - NONE")
-        result_raw = self._set_config_subject(subject=f"{topic}-key",
-                                              data=json.dumps(
-                                                  {"compatibility": "NONE"}))
-        assert result_raw.status_code == requests.codes.ok
-
-        self.logger.debug("Posting schema 2 as a subject key")
-        result_raw = self._post_subjects_subject_versions(
-            subject=f"{topic}-key", data=schema_2_data)
-        self.logger.debug(result_raw)
-        assert result_raw.status_code == requests.codes.ok
-
-        self.logger.debug("Posting schema 3 as a subject key")
-        result_raw = self._post_subjects_subject_versions(
-            subject=f"{topic}-key", data=schema_3_data)
-        self.logger.debug(result_raw)
-        assert result_raw.status_code == requests.codes.ok
+        self._prep_three_schemas(subject=f"{topic}-key")
 
         # Check that permanent delete is refused before soft delete
         self.logger.debug("Prematurely permanently delete subject")
         result_raw = self._delete_subject(subject=f"{topic}-key",
                                           permanent=True)
-        self.logger.debug(result_raw)
+        self.logger.debug("%s", result_raw)
         assert result_raw.status_code == requests.codes.not_found
 
         self.logger.debug("delete version 2")
@@ -697,20 +734,20 @@ class SchemaRegistryTest(RedpandaTest):
         self.logger.debug("Get versions")
         result_raw = self._get_subjects_subject_versions(
             subject=f"{topic}-key")
-        self.logger.debug(result_raw)
+        self.logger.debug("%s", result_raw)
         assert result_raw.status_code == requests.codes.not_found
 
         self.logger.debug("Get versions - include deleted")
         result_raw = self._get_subjects_subject_versions(
             subject=f"{topic}-key", deleted=True)
-        self.logger.debug(result_raw)
+        self.logger.debug("%s", result_raw)
         assert result_raw.status_code == requests.codes.ok
         assert result_raw.json() == [1, 2, 3]
 
         self.logger.debug("Permanently delete subject")
         result_raw = self._delete_subject(subject=f"{topic}-key",
                                           permanent=True)
-        self.logger.debug(result_raw)
+        self.logger.debug("%s", result_raw)
         assert result_raw.status_code == requests.codes.ok
         assert result_raw.json() == [1, 2, 3]
 
@@ -720,42 +757,15 @@ class SchemaRegistryTest(RedpandaTest):
         Verify delete subject version
         """
 
-        topic = create_topic_names(1)[0]
-
-        self.logger.debug(f"Register a schema against a subject")
-        schema_1_data = json.dumps({"schema": schema1_def})
-        schema_2_data = json.dumps({"schema": schema2_def})
-        schema_3_data = json.dumps({"schema": schema3_def})
-
-        self.logger.debug("Posting schema 1 as a subject key")
-        result_raw = self._post_subjects_subject_versions(
-            subject=f"{topic}-key", data=schema_1_data)
-        self.logger.debug(result_raw)
-        assert result_raw.status_code == requests.codes.ok
+        topic = next(self._topic_pool)
 
-        self.logger.debug("Set subject config - NONE")
-        result_raw = self._set_config_subject(subject=f"{topic}-key",
-                                              data=json.dumps(
-                                                  {"compatibility": "NONE"}))
-        assert result_raw.status_code == requests.codes.ok
-
-        self.logger.debug("Posting schema 2 as a subject key")
-        result_raw = self._post_subjects_subject_versions(
-            subject=f"{topic}-key", data=schema_2_data)
-        self.logger.debug(result_raw)
-        assert result_raw.status_code == requests.codes.ok
-
-        self.logger.debug("Posting schema 3 as a subject key")
-        result_raw = self._post_subjects_subject_versions(
-            subject=f"{topic}-key", data=schema_3_data)
-        self.logger.debug(result_raw)
-        assert result_raw.status_code == requests.codes.ok
+        self._prep_three_schemas(subject=f"{topic}-key")
 
         self.logger.debug("Permanently delete version 2")
         result_raw = self._delete_subject_version(subject=f"{topic}-key",
                                                   version=2,
                                                   permanent=True)
-        self.logger.debug(result_raw)
+        self.logger.debug("%s", result_raw)
         assert result_raw.status_code == requests.codes.not_found
         assert result_raw.json()["error_code"] == 40407
 
@@ -764,7 +774,7 @@ class SchemaRegistryTest(RedpandaTest):
             subject=f"{topic}-key",
             version=2,
         )
-        self.logger.debug(result_raw)
+        self.logger.debug("%s", result_raw)
         assert result_raw.status_code == requests.codes.ok
 
         self.logger.debug("Soft delete version 2 - second time")
@@ -772,21 +782,21 @@ class SchemaRegistryTest(RedpandaTest):
             subject=f"{topic}-key",
             version=2,
         )
-        self.logger.debug(result_raw)
+        self.logger.debug("%s", result_raw)
         assert result_raw.status_code == requests.codes.not_found
         assert result_raw.json()["error_code"] == 40406
 
         self.logger.debug("Get versions")
         result_raw = self._get_subjects_subject_versions(
             subject=f"{topic}-key")
-        self.logger.debug(result_raw)
+        self.logger.debug("%s", result_raw)
         assert result_raw.status_code == requests.codes.ok
         assert result_raw.json() == [1, 3]
 
         self.logger.debug("Get versions - include deleted")
         result_raw = self._get_subjects_subject_versions(
             subject=f"{topic}-key", deleted=True)
-        self.logger.debug(result_raw)
+        self.logger.debug("%s", result_raw)
         assert result_raw.status_code == requests.codes.ok
         assert result_raw.json() == [1, 2, 3]
 
@@ -794,14 +804,14 @@ class SchemaRegistryTest(RedpandaTest):
         result_raw = self._delete_subject_version(subject=f"{topic}-key",
                                                   version=2,
                                                   permanent=True)
-        self.logger.debug(result_raw)
+        self.logger.debug("%s", result_raw)
         assert result_raw.status_code == requests.codes.ok
 
         self.logger.debug("Permanently delete version 2 - second time")
         result_raw = self._delete_subject_version(subject=f"{topic}-key",
                                                   version=2,
                                                   permanent=True)
-        self.logger.debug(result_raw)
+        self.logger.debug("%s", result_raw)
         assert result_raw.status_code == requests.codes.not_found
         assert result_raw.json()["error_code"] == 40402
 
@@ -810,18 +820,16 @@ class SchemaRegistryTest(RedpandaTest):
         """
         Exercise unfriendly ordering of soft/hard version deletes
         """
-        topic = create_topic_names(1)[0]
+        topic = next(self._topic_pool)
         subject = f"{topic}-key"
-        schema_1_data = json.dumps({"schema": schema1_def})
-        schema_2_data = json.dumps({"schema": schema2_def})
 
         result_raw = self._post_subjects_subject_versions(subject=subject,
-                                                          data=schema_1_data)
+                                                          data=schema1_data)
         assert result_raw.status_code == requests.codes.ok
         assert result_raw.json() == {"id": 1}
 
         result_raw = self._post_subjects_subject_versions(subject=subject,
-                                                          data=schema_2_data)
+                                                          data=schema2_data)
         assert result_raw.status_code == requests.codes.ok
         assert result_raw.json() == {"id": 2}
 
@@ -891,12 +899,17 @@ class SchemaRegistryTest(RedpandaTest):
 
     @cluster(num_nodes=4)
     def test_concurrent_writes(self):
-        # Warm up the servers (schema_registry doesn't create topic etc before first access)
-        for node in self.redpanda.nodes:
-            r = self._request("GET",
-                              "subjects",
-                              hostname=node.account.hostname)
-            assert r.status_code == requests.codes.ok
+        # Even this relatively small number of concurrent writers is
+        # more stress than the system will encounter in the field: schemas
+        # are likely to be written occasionally and not from many clients
+        # at once.  However, it is enough to push the system to hit its
+        # collision/retry path for writes.  Release runs go further.
+        if self.scale.release:
+            n_workers = 32
+            subjects_per_worker = 512
+        else:
+            n_workers = 4
+            subjects_per_worker = 16
 
         node_names = [n.account.hostname for n in self.redpanda.nodes]
 
@@ -916,7 +929,9 @@ class SchemaRegistryTest(RedpandaTest):
             def _worker(self, idx, node):
                 node.account.copy_to(src_path, dest_path)
                 ssh_output = node.account.ssh_capture(
-                    f"{python} {dest_path} {' '.join(node_names)}")
+                    f"{python} {dest_path} --workers {n_workers} "
+                    f"--subjects-per-worker {subjects_per_worker} "
+                    f"{' '.join(node_names)}")
                 for line in ssh_output:
                     logger.info(line)
 
@@ -1,8 +1,10 @@
 # This is not a test.  It is a remote script for use by schema_registry_test.py
 
-import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+import argparse
 import requests
-import sys
+from requests.adapters import HTTPAdapter
+import threading
 import logging
 import random
 import time
@@ -15,6 +17,14 @@ log.addHandler(logging.StreamHandler())
 # How many errors before a worker gives up?
 max_errs = 1
 
+# How many times to retry a request that got an error response.  With the
+# default backoff this waits about 10s in total on average (at most ~19s),
+# similar to the 10s the test itself allows for transient errors.
+max_retries = 14
+
+# How many requests may be in flight at once, across all workers
+max_requests_in_flight = 16
+
 HTTP_GET_HEADERS = {"Accept": "application/vnd.schemaregistry.v1+json"}
 
 HTTP_POST_HEADERS = {
@@ -22,20 +32,50 @@ HTTP_POST_HEADERS = {
     "Content-Type": "application/vnd.schemaregistry.v1+json"
 }
 
+# Error codes that may appear during normal API operation, do not
+# indicate an issue with the service
+ACCEPTABLE_ERRORS = frozenset({409, 422, 404})
+
+
+def accept_response(resp):
+    return 200 <= resp.status_code < 300 or resp.status_code in ACCEPTABLE_ERRORS
+
+
 schema_template = '{"type":"record","name":"record_%s","fields":[{"type":"string","name":"f1"}]}'
 
 
-class WriteWorker(threading.Thread):
-    def __init__(self, name, count, node_names):
-        super(WriteWorker, self).__init__()
+class WriteWorker:
+    def __init__(self,
+                 name,
+                 count,
+                 node_names,
+                 executor,
+                 barrier,
+                 backoff_base=0.05,
+                 backoff_cap=2.0):
         self.name = name
         self.count = count
         self.schema_counter = 1
         self.results = {}
         self.nodes = node_names
+        self.base_uris = {n: f"http://{n}:8081/" for n in node_names}
+        self.executor = executor
+        self.barrier = barrier
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
 
         self.errors = []
 
+        # Keep connections to each node open across requests.  Retries are
+        # done by _request, with backoff, rather than by urllib3.  We never
+        # have more requests in flight than the shared request pool allows.
+        self.session = requests.Session()
+        self.session.mount(
+            "http://",
+            HTTPAdapter(pool_connections=len(node_names),
+                        pool_maxsize=min(count, max_requests_in_flight),
+                        max_retries=0))
+
     def _request(self, verb, path, hostname=None, **kwargs):
         """
 
@@ -48,41 +88,40 @@ class WriteWorker(threading.Thread):
         if hostname is None:
             # Pick hostname once: we will retry the same place we got an error,
             # to avoid silently skipping hosts that are persistently broken
-            nodes = [n for n in self.nodes]
-            random.shuffle(nodes)
-            hostname = nodes[0]
-
-        uri = f"http://{hostname}:8081/{path}"
+            hostname = random.choice(self.nodes)
 
-        if 'timeout' not in kwargs:
-            kwargs['timeout'] = 60
+        uri = self.base_uris[hostname] + path
 
-        # Error codes that may appear during normal API operation, do not
-        # indicate an issue with the service
-        acceptable_errors = {409, 422, 404}
-
-        def accept_response(resp):
-            return 200 <= resp.status_code < 300 or resp.status_code in acceptable_errors
+        kwargs.setdefault('timeout', 60)
 
         log.debug(f"{verb} hostname={hostname} {path} {kwargs}")
 
-        # This is not a retry loop: you get *one* retry to handle issues
-        # during startup, after that a failure is a failure.
-        r = requests.request(verb, uri, **kwargs)
-        if not accept_response(r):
+        r = self.session.request(verb, uri, **kwargs)
+        if accept_response(r):
+            log.info(
+                f"{r.status_code} {verb} hostname={hostname} {path} {kwargs}")
+            return r
+
+        # Retry errors with full-jitter exponential backoff, so that workers
+        # don't all come back to the server at once.
+        for attempt in range(max_retries):
             log.info(
                 f"Retrying for error {r.status_code} on {verb} {path} ({r.text})"
             )
-            time.sleep(10)
-            r = requests.request(verb, uri, **kwargs)
+            time.sleep(
+                random.uniform(
+                    0, min(self.backoff_cap, self.backoff_base * 2**attempt)))
+            r = self.session.request(verb, uri, **kwargs)
             if accept_response(r):
-                log.info(
-                    f"OK after retry {r.status_code} on {verb} {path} ({r.text})"
-                )
-            else:
-                log.info(
-                    f"Error after retry {r.status_code} on {verb} {path} ({r.text})"
-                )
+                break
+
+        if accept_response(r):
+            log.info(
+                f"OK after retry {r.status_code} on {verb} {path} ({r.text})")
+        else:
+            log.info(
+                f"Error after retry {r.status_code} on {verb} {path} ({r.text})"
+            )
 
         log.info(f"{r.status_code} {verb} hostname={hostname} {path} {kwargs}")
 
@@ -111,26 +150,51 @@ class WriteWorker(threading.Thread):
         return self._request("GET", f"schemas/ids/{id}", headers=headers)
 
     def create(self):
+        # Subjects are independent of one another, so issue all the POSTs
+        # up front and check the responses as they arrive.
+        futures = {}
         for i in range(0, self.count):
             subject = f"subject_{self.name}_{i}"
             version_id = 1
             schema_def = schema_template % f"{self.name}_{i}"
 
             log.debug(f"Worker {self.name} writing subject {subject}")
-            try:
-                resp = self._post_subjects_subject_versions(
-                    subject=subject,
-                    data=json.dumps({"schema": schema_def}),
-                    timeout=20)
-            except requests.exceptions.RequestException as e:
-                self._push_err(f"{subject}/{version_id} POST exception: {e}")
-            else:
-                self._check_eq(subject, version_id, "post_ret",
-                               resp.status_code, 200)
-                if resp.status_code == 200:
-                    schema_id = resp.json()["id"]
-                    self.results[(subject, version_id)] = (schema_def,
-                                                           schema_id)
+            f = self.executor.submit(self._post_subjects_subject_versions,
+                                     subject=subject,
+                                     data=json.dumps({
+                                         "schema": schema_def
+                                     }).encode(),
+                                     timeout=20)
+            futures[f] = (subject, version_id, schema_def)
+
+        try:
+            for f in as_completed(futures):
+                subject, version_id, schema_def = futures[f]
+                try:
+                    resp = f.result()
+                except requests.exceptions.RequestException as e:
+                    self._push_err(
+                        f"{subject}/{version_id} POST exception: {e}")
+                else:
+                    self._check_eq(subject, version_id, "post_ret",
+                                   resp.status_code, 200)
+                    if resp.status_code == 200:
+                        schema_id = resp.json()["id"]
+                        self.results[(subject, version_id)] = (schema_def,
+                                                               schema_id)
+        finally:
+            self._cancel(futures)
+
+    def _cancel(self, futures):
+        """
+        Cancel any of our requests that have not started yet: if we gave up
+        early, they would otherwise all still be sent before the request
+        pool can shut down.  Then wait for those already in flight, so that
+        nothing is still using our session once we return.
+        """
+        for f in futures:
+            f.cancel()
+        wait(futures)
 
     def _push_err(self, err):
         log.error(f"push_err[{self.name}]: {err}")
@@ -144,42 +208,67 @@ class WriteWorker(threading.Thread):
             self._push_err(f"{subject}/{version} failed {check_name} {a}!={b}")
 
     def verify(self):
+        # Issue all the reads up front, then check them as they complete
+        version_futures = {}
+        id_futures = {}
+        schema_ids = []
         for (subject, version), (schema_def,
                                  schema_id) in self.results.items():
-            try:
-                r = self._get_subjects_subject_versions_version(
-                    subject, version)
-            except requests.exceptions.RequestException as e:
-                self._push_err(
-                    f"{subject}/{version} GET version exception: {e}")
-                continue
-
-            self._check_eq(subject, version, "subject_retcode", r.status_code,
-                           200)
-            self._check_eq(subject, version, "subject",
-                           r.json()['subject'], subject)
-            self._check_eq(subject, version, "version",
-                           r.json()['version'], version)
-            self._check_eq(subject, version, "schema",
-                           r.json()['schema'], schema_def)
-
-            try:
-                r = self._get_schemas_ids_id(id=schema_id)
-            except requests.exceptions.RequestException as e:
-                self._push_err(
-                    f"{subject}/{version} GET schema exception: {e}")
-                continue
-            self._check_eq(subject, version, "schema_retcode", r.status_code,
-                           200)
-            self._check_eq(subject, version, "schema_def",
-                           r.json()['schema'], schema_def)
-
-        schema_ids = self.get_schema_ids()
+            f = self.executor.submit(
+                self._get_subjects_subject_versions_version, subject, version)
+            version_futures[f] = (subject, version, schema_def)
+            f = self.executor.submit(self._get_schemas_ids_id, id=schema_id)
+            id_futures[f] = (subject, version, schema_def)
+            schema_ids.append(schema_id)
+
+        try:
+            for f in as_completed(version_futures):
+                subject, version, schema_def = version_futures[f]
+                try:
+                    r = f.result()
+                except requests.exceptions.RequestException as e:
+                    self._push_err(
+                        f"{subject}/{version} GET version exception: {e}")
+                    continue
+
+                self._check_eq(subject, version, "subject_retcode",
+                               r.status_code, 200)
+                body = r.json()
+                self._check_eq(subject, version, "subject", body['subject'],
+                               subject)
+                self._check_eq(subject, version, "version", body['version'],
+                               version)
+                self._check_eq(subject, version, "schema", body['schema'],
+                               schema_def)
+
+            for f in as_completed(id_futures):
+                subject, version, schema_def = id_futures[f]
+                try:
+                    r = f.result()
+                except requests.exceptions.RequestException as e:
+                    self._push_err(
+                        f"{subject}/{version} GET schema exception: {e}")
+                    continue
+                self._check_eq(subject, version, "schema_retcode",
+                               r.status_code, 200)
+                self._check_eq(subject, version, "schema_def",
+                               r.json()['schema'], schema_def)
+        finally:
+            self._cancel(version_futures)
+            self._cancel(id_futures)
+
         if len(set(schema_ids)) != len(schema_ids):
             self._push_err(f"Schema IDs reused!")
 
     def run(self):
+        """
+        :return: tuple of (errors, schema ids written)
+        """
         try:
+            # Start writing at the same moment as all the other workers, to
+            # maximise contention between them.
+            self.barrier.wait()
+
             t1 = time.time()
             self.create()
             create_dur = time.time() - t1
@@ -191,58 +280,75 @@ class WriteWorker(threading.Thread):
             if len(self.errors) == 0:
                 self.verify()
         except Exception as e:
+            log.exception(f"Worker {self.name} failed")
             self.errors.append(f"Exception!  {e}")
-            raise
+        finally:
+            self.session.close()
+
+        return self.errors, self.get_schema_ids()
 
     def get_schema_ids(self):
-        result = []
-        for (subject, version), (schema_def,
-                                 schema_id) in self.results.items():
-            result.append(schema_id)
+        return [schema_id for _, schema_id in self.results.values()]
+
 
-        return result
+def stress_test(node_names, n_workers, subjects_per_worker):
+    # Workers block on their own requests, so requests are issued on a
+    # separate pool to the workers themselves.
+    request_executor = ThreadPoolExecutor(max_workers=max_requests_in_flight)
 
+    # Workers wait on this before writing, so the executor running them
+    # must have a thread for every worker.
+    barrier = threading.Barrier(n_workers)
 
-def stress_test(node_names):
-    # Even this relatively small number of concurrent writers is
-    # more stress than the system will encounter in the field: schemas
-    # are likely to be written occasionally and not from many clients at once.
-    # However, it is enough to push the system to hit its collision/retry path
-    # for writes.
-    subjects_per_worker = 16
-    n_workers = 4
     workers = []
     for n in range(0, n_workers):
-        worker = WriteWorker(f"{n}", subjects_per_worker, node_names)
+        worker = WriteWorker(f"{n}", subjects_per_worker, node_names,
+                             request_executor, barrier)
         workers.append(worker)
 
-    for worker in workers:
-        worker.start()
-
-    for worker in workers:
-        worker.join()
+    # Run the workers on a pool rather than a thread each, reporting on
+    # each as soon as it finishes.
+    n_errors = 0
+    seen_ids = set()
+    duplicate_ids = []
+    with ThreadPoolExecutor(max_workers=n_workers) as executor:
+        futures = {
+            executor.submit(worker.run): worker.name
+            for worker in workers
+        }
+        for f in as_completed(futures):
+            name = futures[f]
+            errors, schema_ids = f.result()
+            if errors:
+                log.error(f"Worker {name} errors:")
+                for e in errors:
+                    log.error(f"  Worker {name}: {e}")
+            else:
+                log.info(f"Worker {name} OK")
 
-    all_schema_ids = []
-    for worker in workers:
-        if worker.errors:
-            log.error(f"Worker {worker.name} errors:")
-            for e in worker.errors:
-                log.error(f"  Worker {worker.name}: {e}")
-        else:
-            log.info(f"Worker {worker.name} OK")
+            n_errors += len(errors)
+            for schema_id in schema_ids:
+                if schema_id in seen_ids:
+                    duplicate_ids.append(schema_id)
+                else:
+                    seen_ids.add(schema_id)
 
-        all_schema_ids.extend(worker.get_schema_ids())
+    request_executor.shutdown(wait=True)
 
-    assert sum([len(worker.errors) for worker in workers]) == 0
+    assert n_errors == 0
 
     # Check no schema IDs were duplicated
-    assert len(all_schema_ids) == len(set(all_schema_ids))
+    assert not duplicate_ids, f"duplicate schema ids: {duplicate_ids[:10]}"
 
 
 if __name__ == "__main__":
-    node_names = sys.argv[1:]
-
-    assert len(node_names) > 1
-    stress_test(node_names)
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--subjects-per-worker", type=int, default=16)
+    parser.add_argument("node_names", nargs="+")
+    args = parser.parse_args()
+
+    assert len(args.node_names) > 1
+    stress_test(args.node_names, args.workers, args.subjects_per_worker)
 
     log.info("All checks passed")